@@ -7,177 +7,465 @@ but download binaries from bogdanfinn/tls-client since it has regular releases.
 """
 from __future__ import annotations
 
+import functools
+import hashlib
+import importlib.util
+import json
 import os
+import random
+import ssl
 import sys
+import time
 import platform
+from email.utils import format_datetime, parsedate_to_datetime
+from http.client import HTTPException
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
-import requests
-import shutil
-
-# Try to import tls_client to find its location
-try:
-    import tls_client
-    TLS_CLIENT_PATH = os.path.dirname(tls_client.__file__)
-except ImportError:
-    # Fallback: search in site-packages
-    for path in sys.path:
-        if 'site-packages' in path:
-            tls_client_path = os.path.join(path, 'tls_client')
-            if os.path.exists(tls_client_path):
-                TLS_CLIENT_PATH = tls_client_path
-                break
-    else:
-        raise ImportError("tls_client package not found")
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+if TYPE_CHECKING:
+    import requests
+
+# Locate the tls_client package without importing it (importing would load the binary)
+_TLS_CLIENT_SPEC = importlib.util.find_spec("tls_client")
+if _TLS_CLIENT_SPEC is None or _TLS_CLIENT_SPEC.origin is None:
+    raise ImportError("tls_client package not found")
+TLS_CLIENT_PATH = os.path.dirname(_TLS_CLIENT_SPEC.origin)
 
 # Use bogdanfinn/tls-client as the source for binaries (most reliable with releases)
 # RainbowPlug/tls-client is the fork we use, but it doesn't have releases
 GITHUB_API_URL = "https://api.github.com/repos/bogdanfinn/tls-client/releases/latest"
 DEPENDENCIES_DIR = os.path.join(TLS_CLIENT_PATH, "dependencies")
 LOCAL_VERSION_FILE = os.path.join(DEPENDENCIES_DIR, "version.txt")
+LOCAL_VERSION_TEMP_FILE = f"{LOCAL_VERSION_FILE}.tmp"
 CHECK_INTERVAL = timedelta(hours=24)
-
-
+# How long a should_check_update decision is reused within one process
+CHECK_CACHE_TTL = timedelta(hours=1)
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+CHECKSUMS_FILENAME = "checksums.txt"
+# Upper bound (seconds) of the random delay added on top of a rate-limit reset
+RATE_LIMIT_JITTER = 300
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+# Retry policy for transient GitHub errors (5xx and dropped connections)
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 1.5
+RETRY_STATUSES = (500, 502, 503, 504)
+# Longest Retry-After (seconds) honored before retrying, so a check never blocks for long
+RETRY_MAX_WAIT = 30
+
+
+# (sys.platform, machine) -> binary filename
+_PLATFORM_MAP = {
+    ("win32", "amd64"): "tls-client-windows-amd64.dll",
+    ("win32", "x86_64"): "tls-client-windows-amd64.dll",
+    ("win32", "x86"): "tls-client-windows-386.dll",
+    ("win32", "i386"): "tls-client-windows-386.dll",
+    ("linux", "amd64"): "tls-client-linux-amd64.so",
+    ("linux", "x86_64"): "tls-client-linux-amd64.so",
+    ("linux", "arm64"): "tls-client-linux-arm64.so",
+    ("linux", "aarch64"): "tls-client-linux-arm64.so",
+    ("darwin", "arm64"): "tls-client-darwin-arm64.dylib",
+    ("darwin", "aarch64"): "tls-client-darwin-arm64.dylib",
+}
+# Fallback per platform when the machine is not listed above
+_PLATFORM_DEFAULTS = {
+    "win32": "tls-client-windows-amd64.dll",
+    "linux": "tls-client-linux-amd64.so",
+    "darwin": "tls-client-darwin-amd64.dylib",
+}
+
+
+@functools.lru_cache(maxsize=None)
 def get_dependency_filename() -> str:
     """Get the expected binary filename based on platform"""
-    system = platform.system().lower()
-    machine = platform.machine().lower()
-    
-    if system == "windows":
-        if machine in ["amd64", "x86_64"]:
-            return "tls-client-windows-amd64.dll"
-        elif machine in ["x86", "i386"]:
-            return "tls-client-windows-386.dll"
-        else:
-            return "tls-client-windows-amd64.dll"  # Default
-    elif system == "linux":
-        if machine in ["amd64", "x86_64"]:
-            return "tls-client-linux-amd64.so"
-        elif machine in ["arm64", "aarch64"]:
-            return "tls-client-linux-arm64.so"
-        else:
-            return "tls-client-linux-amd64.so"  # Default
-    elif system == "darwin":
-        if machine in ["arm64", "aarch64"]:
-            return "tls-client-darwin-arm64.dylib"
-        else:
-            return "tls-client-darwin-amd64.dylib"
-    else:
-        raise ValueError(f"Unsupported platform: {system}")
+    filename = _PLATFORM_MAP.get((sys.platform, platform.machine().lower()))
+    if filename is None:
+        filename = _PLATFORM_DEFAULTS.get(sys.platform)
+    if filename is None:
+        raise ValueError(f"Unsupported platform: {sys.platform}")
+    return filename
 
 
 CURRENT_DEPENDENCY_FILENAME = get_dependency_filename()
+DEST_PATH = os.path.join(DEPENDENCIES_DIR, CURRENT_DEPENDENCY_FILENAME)
+
+# Marks an argument the caller didn't pass, as opposed to an explicit None
+_UNSET: Any = object()
+
+# (decided_at, result) of the last should_check_update call in this process
+_CHECK_CACHE: Optional[Tuple[datetime, bool]] = None
+
+
+def _to_http_date(value: str) -> Optional[str]:
+    """Convert an ISO-8601 timestamp to an RFC 1123 HTTP date"""
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return format_datetime(dt.astimezone(timezone.utc), usegmt=True)
+
+
+def _from_http_date(value: Optional[str]) -> Optional[float]:
+    """Convert an RFC 1123 HTTP date to a POSIX timestamp"""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """TLS context for urllib, using certifi's CA bundle like requests does when available"""
+    try:
+        import certifi
+    except ImportError:
+        return ssl.create_default_context()
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """
+    Whether a failed request is worth retrying: dropped or reset connections only.
+
+    DNS failures, certificate errors and timeouts would just fail again (or hang again).
+    """
+    reason = error.reason if isinstance(error, URLError) else error
+    return isinstance(reason, (ConnectionResetError, ConnectionAbortedError, HTTPException))
+
+
+def _conditional_get(url: str, headers: Dict[str, str], timeout: float = 30) -> Tuple[int, Any, Any]:
+    """
+    GET a URL with urllib, retrying transient failures.
+
+    Returns (status, headers, body). Non-2xx responses such as 304 are returned
+    instead of raised; the body is a file-like object the caller must close.
+    """
+    request = Request(url, headers={'User-Agent': USER_AGENT, **headers})
+    attempt = 0
+    while True:
+        retry_after = ''
+        try:
+            response = urlopen(request, timeout=timeout, context=_ssl_context())
+            return response.status, response.headers, response
+        except HTTPError as e:
+            if e.code not in RETRY_STATUSES or attempt >= RETRY_TOTAL:
+                return e.code, e.headers, e
+            retry_after = e.headers.get('Retry-After', '')
+            e.close()
+        except (URLError, HTTPException) as e:
+            if attempt >= RETRY_TOTAL or not _is_transient_error(e):
+                raise
+
+        if retry_after.isdigit():
+            delay = min(int(retry_after), RETRY_MAX_WAIT)
+        else:
+            delay = RETRY_BACKOFF_FACTOR * (2 ** attempt)
+        time.sleep(delay)
+        attempt += 1
 
 
-def get_latest_release(session: requests.Session) -> tuple[Any, str | None] | None:
+def get_latest_release(
+    local_version_info: Optional[Dict[str, str]] = _UNSET
+) -> tuple[Any, str | None, str | None] | None:
     """Get the latest release from bogdanfinn/tls-client GitHub API"""
     headers = {}
     github_token = os.getenv("GITHUB_TOKEN")
     if github_token:
         headers["Authorization"] = f"Bearer {github_token}"
 
-    local_version_info = read_local_version()
-    if local_version_info and 'Etag' in local_version_info:
-        headers['If-None-Match'] = local_version_info['Etag']
+    if local_version_info is _UNSET:
+        local_version_info = read_local_version()
+    if local_version_info and local_version_info.get('etag'):
+        headers['If-None-Match'] = local_version_info['etag']
+    if local_version_info:
+        # Prefer the server's own Last-Modified value, fall back to the release date
+        if_modified_since = local_version_info.get('http_last_modified')
+        if not if_modified_since and local_version_info.get('last_modified'):
+            if_modified_since = _to_http_date(local_version_info['last_modified'])
+        if if_modified_since:
+            headers['If-Modified-Since'] = if_modified_since
 
     try:
-        response = session.get(GITHUB_API_URL, headers=headers, timeout=30)
-        if response.status_code == 304:  # Not Modified
-            return None
+        status, response_headers, body = _conditional_get(GITHUB_API_URL, headers)
+        with body:
+            if status == 304:  # Not Modified
+                _set_last_check()
+                return None
+            if status in (403, 429):
+                _record_rate_limit(response_headers)
+            if status >= 400:
+                raise HTTPError(GITHUB_API_URL, status, body.reason, response_headers, None)
+
+            # Parse straight from the socket instead of buffering the body first
+            latest_release = json.load(body)
 
-        response.raise_for_status()
-        latest_release = response.json()
-        
         # Check if release has assets (releases without assets are not useful)
         if not latest_release.get("assets") or len(latest_release["assets"]) == 0:
             print("No assets found in release")
             return None
-        
-        return latest_release, response.headers.get('Etag')
-    except requests.RequestException as e:
+
+        return latest_release, response_headers.get('Etag'), response_headers.get('Last-Modified')
+    except (OSError, HTTPException, ValueError) as e:
         print(f"Error fetching latest release from bogdanfinn/tls-client: {e}")
         return None
 
 
+def _record_rate_limit(headers: Any) -> None:
+    """Postpone the next update check until GitHub's rate limit resets"""
+    retry_after = headers.get('Retry-After', '')
+    remaining = headers.get('X-RateLimit-Remaining')
+    reset = headers.get('X-RateLimit-Reset', '')
+
+    if retry_after.isdigit():
+        wait = int(retry_after)
+    elif remaining == '0' and reset.isdigit():
+        wait = max(0, int(reset) - int(time.time()))
+    else:
+        return
+
+    # Spread concurrent processes out instead of having them all retry right at the reset
+    wait += random.uniform(0, RATE_LIMIT_JITTER)
+    next_check = datetime.now(timezone.utc) + timedelta(seconds=wait)
+
+    # Backdate the last check so the regular interval expires exactly at next_check
+    _set_last_check((next_check - CHECK_INTERVAL).timestamp())
+    print(f"GitHub API rate limit reached, next update check after {next_check.isoformat()}")
+
+
 def read_local_version() -> Optional[Dict[str, str]]:
     """Read local version information from version.txt"""
     if os.path.exists(LOCAL_VERSION_FILE):
         try:
             with open(LOCAL_VERSION_FILE, "r") as f:
-                lines = f.read().splitlines(False)
-                if len(lines) >= 3:
-                    return {
-                        'version': lines[0],
-                        'last_modified': lines[1],
-                        'last_check': lines[2],
-                        'Etag': lines[3] if len(lines) >= 4 else None
-                    }
+                info = json.loads(f.read())
+            if isinstance(info, dict):
+                return info
+        except json.JSONDecodeError:
+            # Pre-JSON line-based version.txt; treat it as missing until it is rewritten
+            pass
         except Exception as e:
             print(f"Error reading version file: {e}")
     return None
 
 
-def save_local_version(version: str, last_modified: str, etag: Optional[str] = None) -> None:
+def save_local_version(
+    version: str,
+    last_modified: str,
+    etag: Optional[str] = None,
+    http_last_modified: Optional[str] = None
+) -> None:
     """Save version information to version.txt"""
+    _write_version_info({
+        'version': version,
+        'last_modified': last_modified,
+        'etag': etag,
+        'http_last_modified': http_last_modified
+    })
+
+
+def _write_version_info(info: Dict[str, Any]) -> None:
+    """Atomically replace version.txt with the given info"""
+    global _CHECK_CACHE
+
+    # Writing version.txt moves its mtime, so the cached decision is stale
+    _CHECK_CACHE = None
     os.makedirs(DEPENDENCIES_DIR, exist_ok=True)
-    now = datetime.now(timezone.utc).isoformat()
+    # Write to a temporary file and rename it so a partial write can't corrupt version.txt
     try:
-        with open(LOCAL_VERSION_FILE, "w") as f:
-            f.write(f"{version}\n{last_modified}\n{now}")
-            if etag:
-                f.write(f"\n{etag}")
+        with open(LOCAL_VERSION_TEMP_FILE, "w") as f:
+            f.write(json.dumps(info))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(LOCAL_VERSION_TEMP_FILE, LOCAL_VERSION_FILE)
     except Exception as e:
         print(f"Error saving version file: {e}")
 
 
-def download_file(session: requests.Session, url: str, dest_path: str) -> bool:
-    """Download a file from URL to destination path"""
+def _matches_remote_file(session: requests.Session, url: str, dest_path: str) -> bool:
+    """
+    Check with a HEAD request whether the local file already matches the remote one.
+
+    Both the Content-Length and the Last-Modified date (which download_file stamps
+    onto the file as its mtime) must match.
+    """
+    import requests
+
+    if not os.path.exists(dest_path):
+        return False
     try:
-        response = session.get(url, timeout=60, stream=True)
+        response = session.head(url, timeout=10, allow_redirects=True)
         response.raise_for_status()
-        
-        # Create backup of existing file if it exists
-        if os.path.exists(dest_path):
-            backup_path = f"{dest_path}.backup"
-            shutil.copy2(dest_path, backup_path)
-        
-        # Download to temporary file first
-        temp_path = f"{dest_path}.tmp"
-        with open(temp_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        
-        # Move temp file to final location
-        shutil.move(temp_path, dest_path)
-        
-        # Remove backup if download succeeded
-        backup_path = f"{dest_path}.backup"
-        if os.path.exists(backup_path):
-            os.remove(backup_path)
-        
+    except requests.RequestException:
+        return False
+    content_length = response.headers.get('Content-Length', '')
+    if not content_length.isdigit() or int(content_length) != os.path.getsize(dest_path):
+        return False
+    remote_mtime = _from_http_date(response.headers.get('Last-Modified'))
+    return remote_mtime is not None and int(remote_mtime) == int(os.path.getmtime(dest_path))
+
+
+def _file_sha256(path: str) -> Optional[str]:
+    """SHA-256 hex digest of a local file, or None if it doesn't exist"""
+    if not os.path.exists(path):
+        return None
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def get_expected_sha256(session: requests.Session, asset: Dict[str, Any], assets: List[Dict[str, Any]]) -> Optional[str]:
+    """Get the published SHA-256 of a release asset, if the release provides one"""
+    import requests
+
+    # GitHub reports a digest for each asset on newer releases
+    digest = asset.get("digest") or ""
+    if digest.startswith("sha256:"):
+        return digest.split(":", 1)[1].lower()
+
+    checksums = next((a for a in assets if a["name"] == CHECKSUMS_FILENAME), None)
+    if checksums is None:
+        return None
+    try:
+        response = session.get(checksums["browser_download_url"], timeout=30)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Error fetching {CHECKSUMS_FILENAME}: {e}")
+        return None
+
+    # Each line is "<sha256>  <filename>"
+    for line in response.text.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[1].lstrip("*") == asset["name"]:
+            return parts[0].lower()
+    return None
+
+
+def download_file(
+    session: requests.Session,
+    url: str,
+    dest_path: str,
+    expected_sha256: Optional[str] = None
+) -> bool:
+    """Download a file from URL to destination path, verifying its SHA-256 if given"""
+    # Download to temporary file first; the existing binary stays untouched until the final rename
+    temp_path = f"{dest_path}.tmp"
+    try:
+        # With a published hash only a verified file may be kept; otherwise fall back to a HEAD probe
+        if expected_sha256:
+            up_to_date = _file_sha256(dest_path) == expected_sha256
+        else:
+            up_to_date = _matches_remote_file(session, url, dest_path)
+        if up_to_date:
+            print(f"{os.path.basename(dest_path)} is already up to date, skipping download")
+            return True
+
+        with session.get(url, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            remote_mtime = _from_http_date(response.headers.get('Last-Modified'))
+
+            # Copy straight from the socket into the temporary file, hashing as we go
+            response.raw.decode_content = True
+            sha256 = hashlib.sha256()
+            with open(temp_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                while True:
+                    chunk = response.raw.read(DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    sha256.update(chunk)
+                    f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+
+        if expected_sha256 and sha256.hexdigest() != expected_sha256:
+            raise ValueError(f"SHA-256 mismatch: expected {expected_sha256}, got {sha256.hexdigest()}")
+
+        # Keep the upstream Last-Modified as mtime so later HEAD probes can compare against it
+        if remote_mtime is not None:
+            os.utime(temp_path, (remote_mtime, remote_mtime))
+
+        # Atomically swap the temp file into place
+        os.replace(temp_path, dest_path)
         return True
     except Exception as e:
         print(f"Error downloading file: {e}")
-        # Restore backup if download failed
-        backup_path = f"{dest_path}.backup"
-        if os.path.exists(backup_path):
-            shutil.move(backup_path, dest_path)
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
         return False
 
 
+def _cached_check_result() -> Optional[bool]:
+    """Return the in-process should_check_update decision if it is still fresh"""
+    if _CHECK_CACHE is None:
+        return None
+    checked_at, result = _CHECK_CACHE
+    if datetime.now(timezone.utc) - checked_at > CHECK_CACHE_TTL:
+        return None
+    return result
+
+
 def should_check_update() -> bool:
     """Check if we should check for updates based on last check time"""
-    local_version_info = read_local_version()
-    if not local_version_info or 'last_check' not in local_version_info:
-        return True
-    
+    global _CHECK_CACHE
+
+    cached = _cached_check_result()
+    if cached is not None:
+        return cached
+
+    result = _is_check_due()
+    _CHECK_CACHE = (datetime.now(timezone.utc), result)
+    return result
+
+
+def _is_check_due() -> bool:
+    """Decide from the mtime of version.txt whether a new check is due"""
     try:
-        last_check = datetime.fromisoformat(local_version_info['last_check'])
-        return datetime.now(timezone.utc) - last_check > CHECK_INTERVAL
-    except Exception:
+        return time.time() - os.stat(LOCAL_VERSION_FILE).st_mtime > CHECK_INTERVAL.total_seconds()
+    except OSError:
         return True
 
 
+def _set_last_check(timestamp: Optional[float] = None) -> None:
+    """Record a check by setting the mtime of version.txt (defaults to now)"""
+    global _CHECK_CACHE
+
+    _CHECK_CACHE = None
+    try:
+        if not os.path.exists(LOCAL_VERSION_FILE):
+            _write_version_info({})
+        times = None if timestamp is None else (timestamp, timestamp)
+        os.utime(LOCAL_VERSION_FILE, times)
+    except OSError as e:
+        print(f"Error saving version file: {e}")
+
+
+def _make_session() -> requests.Session:
+    """Create the HTTP session used for binary downloads"""
+    # Imported lazily so the common no-update path never pays for loading requests
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=list(RETRY_STATUSES),
+        respect_retry_after_header=True
+    )
+    # Only the release host and its CDN redirect target are ever contacted, and both
+    # the HEAD probe and the download reuse the same kept-alive connection
+    session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=retry))
+    return session
+
+
 def update_lib(force: bool = False) -> bool:
     """
     Update tls-client binaries if a new version is available.
@@ -191,57 +479,50 @@ def update_lib(force: bool = False) -> bool:
     if not force and not should_check_update():
         return True
 
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    })
-
-    os.makedirs(DEPENDENCIES_DIR, exist_ok=True)
+    local_version_info = read_local_version()
 
-    result = get_latest_release(session)
+    result = get_latest_release(local_version_info)
     if result is None:
         if force:
             print("No update available or already up to date")
         return True
 
-    latest_release, etag = result
+    latest_release, etag, http_last_modified = result
     latest_version = latest_release["tag_name"]
     last_modified = latest_release.get("published_at", datetime.now(timezone.utc).isoformat())
-    
-    local_version_info = read_local_version()
 
     if not force and local_version_info and latest_version == local_version_info.get('version'):
         # Update last check time even if version is the same
-        save_local_version(latest_version, last_modified, etag)
+        save_local_version(latest_version, last_modified, etag, http_last_modified)
         return True
 
     print(f"New version found: {latest_version}. Updating...")
+    os.makedirs(DEPENDENCIES_DIR, exist_ok=True)
 
     assets = latest_release["assets"]
-    dependency_base = CURRENT_DEPENDENCY_FILENAME.rsplit(".", 1)[0]
-    
-    found_asset = False
-    for asset in assets:
-        if asset["name"].startswith(dependency_base):
-            download_url = asset["browser_download_url"]
-            dest_path = os.path.join(DEPENDENCIES_DIR, CURRENT_DEPENDENCY_FILENAME)
-            
-            print(f"Downloading {CURRENT_DEPENDENCY_FILENAME} from {download_url}...")
-            if download_file(session, download_url, dest_path):
-                print(f"Successfully downloaded {CURRENT_DEPENDENCY_FILENAME}")
-                save_local_version(latest_version, last_modified, etag)
-                print(f"Updated to version {latest_version}")
-                found_asset = True
-                return True
-            else:
-                print(f"Failed to download {CURRENT_DEPENDENCY_FILENAME}")
-                return False
-    
-    if not found_asset:
+    asset = {a["name"]: a for a in assets}.get(CURRENT_DEPENDENCY_FILENAME)
+    if asset is None:
+        # Fall back to a prefix match for releases that name their assets differently
+        dependency_base = CURRENT_DEPENDENCY_FILENAME.rsplit(".", 1)[0]
+        asset = next((a for a in assets if a["name"].startswith(dependency_base)), None)
+
+    if asset is None:
         print(f"Could not find asset for {CURRENT_DEPENDENCY_FILENAME}")
         print(f"Available assets: {[a['name'] for a in assets]}")
         return False
-    
+
+    download_url = asset["browser_download_url"]
+
+    print(f"Downloading {CURRENT_DEPENDENCY_FILENAME} from {download_url}...")
+    session = _make_session()
+    expected_sha256 = get_expected_sha256(session, asset, assets)
+    if not download_file(session, download_url, DEST_PATH, expected_sha256):
+        print(f"Failed to download {CURRENT_DEPENDENCY_FILENAME}")
+        return False
+
+    print(f"Successfully downloaded {CURRENT_DEPENDENCY_FILENAME}")
+    save_local_version(latest_version, last_modified, etag, http_last_modified)
+    print(f"Updated to version {latest_version}")
     return True
 
 